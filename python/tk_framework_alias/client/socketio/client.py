@@ -8,12 +8,16 @@
 # agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
 # not expressly granted therein are reserved by Autodesk, Inc.
 
+import concurrent.futures
 import json
 import logging
+import os
 import socketio
 import threading
 
 from .client_json import AliasClientJSON
+from .client_response import ClientResponse
+from .proxy_wrapper import AliasClientObjectProxyWrapper
 from ..utils.decorators import check_server_result, check_client_connection
 from tk_framework_alias_utils import utils as framework_utils
 
@@ -33,6 +37,15 @@ class AliasSocketIoClient(socketio.Client):
     the client side.
     """
 
+    # The Alias Python API cache file (path and modified time) that the api modules were last
+    # loaded from. Used to determine if the api has changed and the modules need re-creating.
+    # The api modules and types are registered for all clients, so this is shared too.
+    __alias_api_cache_stamp = None
+
+    # The time in seconds to wait for the server response, before processing client events
+    # again (see `_wait_for_response`).
+    _response_wait_interval = 0.01
+
     def __init__(self, *args, **kwargs):
         """Initialize the client."""
 
@@ -40,8 +53,12 @@ class AliasSocketIoClient(socketio.Client):
             # Default to the Alias client JSON if not provided.
             self.__json = AliasClientJSON
             kwargs["json"] = self.__json
+            self.__json_encoder = self.__json.encoder_class()
+            self.__json_decoder = self.__json.decoder_class()
         else:
             self.__json = None
+            self.__json_encoder = None
+            self.__json_decoder = None
 
         # If no logger specified, provide a default logger that will write to the Alisa plugin
         # install directory (as specified n the environment utils).
@@ -62,20 +79,22 @@ class AliasSocketIoClient(socketio.Client):
 
         # The callbacks registry. Callback functions passed to the server are stored in the
         # client by their id, such that they can be looked up and executed when the server
-        # triggers the callback.
+        # triggers the callback. The registry is only ever accessed with single dict
+        # operations (get, set, contains), which are atomic in CPython, so no lock is needed.
         self.__callbacks = {}
-        # A lock to ensure callbacks are accessed thread-safely
-        self.__callback_lock = threading.Lock()
 
         # A lock to ensure events are emitted thread-safely
         self.__message_queue_lock = threading.Lock()
 
-        # A list of namespaces that are registered to this client.
-        self.__namespaces = []
         # The default namespace to use for this client (e.g. if no namespace is given on
         # emitting an event, this default namespace is used).
         self._default_namespace = None
 
+        # The Alias Python API module proxy decoded by this client, with the stamp (path and
+        # modified time) of the cache file it was decoded from. The module proxy is reused
+        # until the cache file changes, or the client is started again.
+        self.__api_module_cache = None
+
     # -------------------------------------------------------------------------------------------------------
     # Properties
 
@@ -90,21 +109,16 @@ class AliasSocketIoClient(socketio.Client):
     def get_json_encoder(self):
         """Get the JSON encoder class used to handle serializing data with the server."""
 
-        if self.__json is AliasClientJSON:
-            return self.__json.encoder_class()
-        return None
+        return self.__json_encoder
 
     def get_json_decoder(self):
         """Get the JSON decoder class used to handle serializing data with the server."""
 
-        if self.__json is AliasClientJSON:
-            return self.__json.decoder_class()
-        return None
+        return self.__json_decoder
 
     def add_namespace(self, namespace_handler):
-        """Register a namespace handler and add it to the list of namespaces for this client."""
+        """Register a namespace handler, to connect to its namespace on start."""
 
-        self.__namespaces.append(namespace_handler.namespace)
         self.register_namespace(namespace_handler)
 
     def start(self, hostname, port):
@@ -120,11 +134,18 @@ class AliasSocketIoClient(socketio.Client):
         if self.connected:
             self.disconnect()
 
+        # Decode the api module again for the new connection
+        self.__api_module_cache = None
+
         # TODO secure https
         url = f"http://{hostname}:{port}"
+        # Connect to the namespaces of the registered namespace handlers. The socketio client
+        # keeps the handlers by namespace. The server is on the local host, connect with the
+        # websocket transport directly instead of starting with long-polling and upgrading.
         self.connect(
             url,
-            namespaces=self.__namespaces,
+            namespaces=list(self.namespace_handlers),
+            transports=["websocket"],
             wait_timeout=self.__timeout,
         )
 
@@ -168,9 +189,7 @@ class AliasSocketIoClient(socketio.Client):
         :rtype: bool
         """
 
-        callback_id = self.get_callback_id(callback)
-        with self.__callback_lock:
-            return callback_id in self.__callbacks
+        return self.get_callback_id(callback) in self.__callbacks
 
     def get_callback(self, callback_id):
         """
@@ -180,20 +199,21 @@ class AliasSocketIoClient(socketio.Client):
         :type callback_id: str
         """
 
-        with self.__callback_lock:
-            return self.__callbacks.get(callback_id)
+        return self.__callbacks.get(callback_id)
 
     def set_callback(self, callback):
         """
-        Register the callback to the client.
+        Register the callback to the client, if it is not registered already.
 
         :param callback: The callback to register.
         :type callback: function
+
+        :return: The unique id for the callback.
+        :rtype: str
         """
 
         callback_id = self.get_callback_id(callback)
-        with self.__callback_lock:
-            self.__callbacks[callback_id] = callback
+        self.__callbacks.setdefault(callback_id, callback)
         return callback_id
 
     #####################################################################################
@@ -215,11 +235,34 @@ class AliasSocketIoClient(socketio.Client):
         """
 
         # Set a default namespace, if not given.
-        if kwargs.get("namespace") is None and self._default_namespace:
+        if self._default_namespace and kwargs.get("namespace") is None:
             kwargs["namespace"] = self._default_namespace
 
+        # This follows the socketio Client.call method of the bundled python-socketio 5.11 (see
+        # the dist frozen_requirements.txt), but only the emit is serialized by the lock.
+        # Waiting for the server response is done outside of the lock, so that other threads
+        # are not blocked from emitting for the duration of this request. The copied response
+        # handling is checked against Client.call in test_client.py, update both if
+        # python-socketio is upgraded.
+        timeout = kwargs.pop("timeout", 60)
+        callback_event = self.eio.create_event()
+        callback_args = []
+
+        def event_callback(*args):
+            callback_args.append(args)
+            callback_event.set()
+
+        kwargs["callback"] = event_callback
         with self.__message_queue_lock:
-            return self.call(*args, **kwargs)
+            self.emit(*args, **kwargs)
+
+        if not callback_event.wait(timeout=timeout):
+            raise socketio.exceptions.TimeoutError()
+
+        result = callback_args[0]
+        if len(result) > 1:
+            return result
+        return result[0] if result else None
 
     @check_server_result
     @check_client_connection
@@ -243,24 +286,21 @@ class AliasSocketIoClient(socketio.Client):
 
         # Set up the response object that will get updated once the api request has returned
         # from the server.
-        response = {
-            "ack": False,  # The request was acknowledged (finished)
-            "result": None,  # The request result
-        }
+        response = ClientResponse()
 
         # Add the event callback to pass to the sio emit method, which will call this function
         # once the server returns.
         kwargs["callback"] = self._get_request_callback(response)
 
-        # Emit the event
-        self.emit_threadsafe(*args, **kwargs)
+        # Emit the event. The client connection has been checked already.
+        self.__emit_threadsafe(*args, **kwargs)
 
         # Wait for the callback to set the event result
         self._wait_for_response(response)
 
         # Check that client is still connected. It is possible that it timed out
         # waiting for the server response, in which case it will disconnect.
-        if not self.connected and not response.get("ack"):
+        if not self.connected and not response.ack:
             raise TimeoutError(
                 (
                     "Client disconnected while waiting for the server "
@@ -271,7 +311,78 @@ class AliasSocketIoClient(socketio.Client):
             )
 
         # Return the result from the server
-        return response.get("result")
+        return response.result
+
+    @check_client_connection
+    def emit_threadsafe_async(self, *args, **kwargs):
+        """
+        Call the emit method in a thread-safe way, and return a Future for the server response.
+
+        This method does not wait for the server response. The Future is resolved with the
+        server response once the server returns, or with the error if the server returned an
+        error (see `_handle_server_error`). Emit multiple requests first, and then wait for all
+        their responses with `wait_for_futures`, so that the total wait time is that of the
+        slowest request, instead of the sum of all requests.
+
+        :param args: The args to pass to the socketio Client.emit method.
+        :type args: List
+        :param kwargs: The key-word arguments to pass to the socketio Client.emit method.
+        :type kwargs: dict
+
+        :return: The Future for the server response.
+        :rtype: concurrent.futures.Future
+        """
+
+        future = concurrent.futures.Future()
+
+        def event_callback(*result):
+            result = result[0] if len(result) == 1 else result
+            try:
+                if isinstance(result, Exception):
+                    result = self._handle_server_error(result)
+            except Exception as error:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+        kwargs["callback"] = event_callback
+        self.__emit_threadsafe(*args, **kwargs)
+        return future
+
+    def wait_for_futures(self, futures):
+        """
+        Wait for the Futures returned by `emit_threadsafe_async` and return their results.
+
+        While waiting for the server responses, client events are processed to avoid blocking
+        the GUI (see `_process_events`).
+
+        :param futures: The Futures to wait for.
+        :type futures: List[concurrent.futures.Future]
+
+        :return: The results of the Futures, in the same order as the Futures given.
+        :rtype: list
+
+        :raises TimeoutError: If the client disconnected before all Futures were resolved.
+        """
+
+        futures = list(futures)
+        interval = self._response_wait_interval
+        while self.connected:
+            if not concurrent.futures.wait(futures, timeout=interval).not_done:
+                break
+            self._process_events()
+
+        if not all(future.done() for future in futures):
+            raise TimeoutError(
+                (
+                    "Client disconnected while waiting for the server "
+                    "response. Server will finish executing the request, and "
+                    "the client will attempt to reconnect once the server "
+                    "is ready."
+                )
+            )
+
+        return [future.result() for future in futures]
 
     @check_server_result
     @check_client_connection
@@ -287,10 +398,23 @@ class AliasSocketIoClient(socketio.Client):
         :type kwargs: dict
         """
 
+        self.__emit_threadsafe(*args, **kwargs)
+
+    def __emit_threadsafe(self, *args, **kwargs):
+        """
+        Call the emit method in a thread-safe way.
+
+        This is the undecorated emit used by the public emit methods, which have already
+        checked the client connection.
+        """
+
         # Set a default namespace, if not given.
-        if kwargs.get("namespace") is None and self._default_namespace:
+        if self._default_namespace and kwargs.get("namespace") is None:
             kwargs["namespace"] = self._default_namespace
 
+        # The socketio Client.emit method is not thread-safe: messages composed of multiple
+        # packets (e.g. binary data) may be sent out of order if emitted concurrently. The
+        # lock is held only while the message is queued, the engineio writer thread sends it.
         with self.__message_queue_lock:
             self.emit(*args, **kwargs)
 
@@ -330,10 +454,31 @@ class AliasSocketIoClient(socketio.Client):
         # client to read and load the module from. This is done to avoid sending
         # the entire module over the network, which can be slow.
         module_filepath = self.call_threadsafe("load_alias_api", timeout=self.__timeout)
-        with open(module_filepath, "r") as fp:
-            module_proxy = json.load(fp, cls=self.get_json_decoder())
-            self.logger.log(logging.DEBUG, module_proxy)
-            return module_proxy
+
+        # Reuse the module proxy if the file has not changed since it was last decoded.
+        api_module_cache = self.__api_module_cache
+        if api_module_cache is not None:
+            cache_stamp = (module_filepath, os.stat(module_filepath).st_mtime_ns)
+            if cache_stamp == api_module_cache[0]:
+                return api_module_cache[1]
+
+        with open(module_filepath, "rb") as fp:
+            # The server only re-writes the file when the Alias Python API has changed (e.g. a
+            # different Alias version), so the modified time changes only with the api. Any
+            # modules created from a different api are removed (before decoding the module,
+            # which creates the api types), so that the module is re-created from this api.
+            # The stamp is taken from the open file to match the data read.
+            cache_stamp = (module_filepath, os.fstat(fp.fileno()).st_mtime_ns)
+            if cache_stamp != AliasSocketIoClient.__alias_api_cache_stamp:
+                AliasClientObjectProxyWrapper.invalidate_all()
+                AliasSocketIoClient.__alias_api_cache_stamp = cache_stamp
+
+            # Read the whole file at once, and decode the UTF-8 JSON bytes in one pass.
+            module_proxy = json.loads(fp.read(), cls=self.get_json_decoder())
+            self.__api_module_cache = (cache_stamp, module_proxy)
+
+        self.logger.log(logging.DEBUG, module_proxy)
+        return module_proxy
 
     def get_alias_api(self):
         """
@@ -361,21 +506,13 @@ class AliasSocketIoClient(socketio.Client):
         Return a function that can be passed as a callback to handle a socketio event callback.
 
         :param response: The response object to pass to the callback to set with the event result data.
-        :type response: dict
+        :type response: ClientResponse
 
         :return: The callback function.
         :rtype: function
         """
 
-        def __request_callback(*result):
-            """Callback invoked when emit finished. The result is the return value of the api request."""
-            if len(result) == 1:
-                response["result"] = result[0]
-            else:
-                response["result"] = result
-            response["ack"] = True
-
-        return __request_callback
+        return response.set_result
 
     def _wait_for_response(self, response):
         """
@@ -390,22 +527,18 @@ class AliasSocketIoClient(socketio.Client):
         disconnects, the response object will indicate the request was not
         acknowledged.
 
-        The response object is a dictionary with two key-values:
+        See ClientResponse for the response object values.
 
-            ack:
-                type: bool
-                description: True if the response has been acknowledged and result is set,
-                             else False if the server has not completed the api request.
-            result:
-                type: any
-                description: The return value from the server api request.
+        Client events are processed at an interval, while waiting for the response event to
+        be set, so that this does not busy-loop when there are no events to process.
 
         :param response: The response object that will be set with the server result once the
             server completes the api request.
-        :type response: dict
+        :type response: ClientResponse
         """
 
-        while not response.get("ack", False) and self.connected:
+        interval = self._response_wait_interval
+        while not response.event.wait(interval) and self.connected:
             self._process_events()
 
     def _process_events(self):
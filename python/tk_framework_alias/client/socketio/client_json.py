@@ -8,8 +8,8 @@
 # agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
 # not expressly granted therein are reserved by Autodesk, Inc.
 
-import inspect
 import json
+import types
 
 from .proxy_wrapper import AliasClientObjectProxyWrapper
 from ..utils.exceptions import AliasClientJSONEncoderError
@@ -31,11 +31,26 @@ class AliasClientJSON:
     @staticmethod
     def dumps(obj, *args, **kwargs):
         """Serialize obj to a JSON formatted str."""
+
+        if not args:
+            # Reuse the encoders for the default and compact formatting, instead of creating
+            # one per call.
+            if not kwargs:
+                return _ENCODER.encode(obj)
+
+            if kwargs == {"separators": (",", ":")}:
+                return _COMPACT_ENCODER.encode(obj)
+
         return json.dumps(obj, cls=AliasClientJSON.encoder_class(), *args, **kwargs)
 
     @staticmethod
     def loads(obj, *args, **kwargs):
         """Deserialize obj instance containing a JSON document to a Python object."""
+
+        # Reuse the decoder when no options are given, instead of creating one per call.
+        if not args and not kwargs and isinstance(obj, str):
+            return _DECODER.decode(obj)
+
         return json.loads(obj, cls=AliasClientJSON.decoder_class(), *args, **kwargs)
 
 
@@ -50,24 +65,50 @@ class AliasClientJSONEncoder(json.JSONEncoder):
     def default(self, obj):
         """Return a serializable object for obj."""
 
-        if isinstance(obj, AliasClientObjectProxyWrapper):
-            return obj.sanitize()
+        # Find the encode method by the object's base classes, most specific first. The map
+        # is keyed by a fixed set of base classes, so that it does not keep references to the
+        # Alias proxy types created at runtime.
+        encode_methods = self.__encode_methods
+        for base_type in type(obj).__mro__:
+            encode_method = encode_methods.get(base_type)
+            if encode_method is not None:
+                return encode_method(self, obj)
+
+        return super(AliasClientJSONEncoder, self).default(obj)
 
-        if isinstance(obj, set):
-            return {
-                "__type__": "set",
-                "__value__": list(obj),
-            }
+    def __encode_proxy(self, obj):
+        """Return a serializable object for an Alias proxy object."""
 
-        if inspect.isclass(obj):
-            return {"__class_name__": obj.__name__}
+        return obj.sanitize()
 
-        if inspect.isfunction(obj) or inspect.ismethod(obj):
-            # Functions must be registered in the AliasSocketIoClient. Since the client io
-            # cannot be accessed here, functions must be encoded before getting to this stage.
-            raise AliasClientJSONEncoderError("Functions should already be encoded.")
+    def __encode_set(self, obj):
+        """Return a serializable object for a set."""
 
-        return super(AliasClientJSONEncoder, self).default(obj)
+        return {
+            "__type__": "set",
+            "__value__": list(obj),
+        }
+
+    def __encode_class(self, obj):
+        """Return a serializable object for a class."""
+
+        return {"__class_name__": obj.__name__}
+
+    def __encode_function(self, obj):
+        """Raise an error for functions, which cannot be serialized."""
+
+        # Functions must be registered in the AliasSocketIoClient. Since the client io
+        # cannot be accessed here, functions must be encoded before getting to this stage.
+        raise AliasClientJSONEncoderError("Functions should already be encoded.")
+
+    # The methods to encode objects by base class.
+    __encode_methods = {
+        AliasClientObjectProxyWrapper: __encode_proxy,
+        set: __encode_set,
+        type: __encode_class,
+        types.FunctionType: __encode_function,
+        types.MethodType: __encode_function,
+    }
 
 
 class AliasClientJSONDecoder(json.JSONDecoder):
@@ -83,19 +124,24 @@ class AliasClientJSONDecoder(json.JSONDecoder):
     def object_hook(self, obj):
         """Decode the JSON serialized object obj to a Python object."""
 
-        if isinstance(obj, dict):
-            if "__exception_class_name__" in obj:
-                # Deserialize an error returned by the server
-                exception_class_name = obj["__exception_class_name__"]
-                exception_class = type(exception_class_name, (Exception,), {})
-                exception_instance = exception_class(
-                    obj.get("__msg__", "Alias Python API error")
-                )
-                return exception_instance
-
-            if obj.get("__type__") == "set":
-                # Deserialize a set object
-                return set(obj.get("__value__"))
+        # The objects that need decoding (errors, sets and Alias objects) are described by
+        # dunder keys, which the server writes first. Return any other object as is, without
+        # checking for each type of object.
+        if not isinstance(obj, dict) or not obj or not next(iter(obj)).startswith("__"):
+            return obj
+
+        if "__exception_class_name__" in obj:
+            # Deserialize an error returned by the server
+            exception_class_name = obj["__exception_class_name__"]
+            exception_class = type(exception_class_name, (Exception,), {})
+            exception_instance = exception_class(
+                obj.get("__msg__", "Alias Python API error")
+            )
+            return exception_instance
+
+        if obj.get("__type__") == "set":
+            # Deserialize a set object
+            return set(obj.get("__value__"))
 
         # Attempt to deserialize the object into an Alias object proxy wrapper
         proxy_obj = AliasClientObjectProxyWrapper.create_proxy(obj)
@@ -104,3 +150,10 @@ class AliasClientJSONDecoder(json.JSONDecoder):
 
         # Return the object as is.
         return obj
+
+
+# The encoder and decoder instances shared by the AliasClientJSON dumps and loads methods. The
+# instances do not store any state between calls.
+_ENCODER = AliasClientJSONEncoder()
+_COMPACT_ENCODER = AliasClientJSONEncoder(separators=(",", ":"))
+_DECODER = AliasClientJSONDecoder()
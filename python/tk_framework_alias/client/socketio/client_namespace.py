@@ -38,11 +38,9 @@ class AliasClientNamespace(socketio.ClientNamespace):
         """
 
         # Look up the method for the event
-        event_method_name = f"on_{event}"
-        if hasattr(self, event_method_name):
-            event_method = getattr(self, event_method_name)
-            if callable(event_method):
-                return event_method(*args)
+        event_method = getattr(self, f"on_{event}", None)
+        if callable(event_method):
+            return event_method(*args)
 
         # No specific event found, check if this is a callback from Alias.
         callback_function = self.client.get_callback(event)
@@ -104,8 +102,9 @@ class AliasClientNamespace(socketio.ClientNamespace):
         args = data.get("args", [])
         kwargs = data.get("kwargs", {})
 
+        # Pass the message args to the logger, to only format the message if it is logged.
         self.client.logger.debug(
-            f"Executing callback function {callback_func.__name__}"
+            "Executing callback function %s", callback_func.__name__
         )
         return callback_func(*args, **kwargs)
 
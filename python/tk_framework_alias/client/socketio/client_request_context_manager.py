@@ -24,6 +24,8 @@ class ClientRequestContextManager:
     send them all at once.
     """
 
+    __slots__ = ("__api_module_proxy", "__is_async", "__result")
+
     def __init__(
         self,
         api_module_proxy: AliasClientModuleProxyWrapper,
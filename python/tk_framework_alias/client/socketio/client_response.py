@@ -0,0 +1,83 @@
+# Copyright (c) 2024 Autodesk Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk Inc.
+
+import threading
+
+
+class ClientResponse:
+    """
+    The response object for a request emitted to the server.
+
+    The response is set by the socketio event callback, once the server has completed the api
+    request. The response has the attributes:
+
+        ack:
+            type: bool
+            description: True if the response has been acknowledged and result is set,
+                         else False if the server has not completed the api request.
+        result:
+            type: any
+            description: The return value from the server api request.
+        event:
+            type: threading.Event
+            description: The event that is set once the response is acknowledged.
+
+    For backward compatibility, the `ack` and `result` values can also be accessed like a
+    dictionary, e.g. `response.get("ack")` or `response["result"]`.
+    """
+
+    __slots__ = ("ack", "result", "event")
+
+    def __init__(self):
+        """Initialize the response object."""
+
+        self.ack = False
+        self.result = None
+        self.event = threading.Event()
+
+    def __getitem__(self, key):
+        """Return the response value for the key."""
+
+        if key not in ("ack", "result"):
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        """
+        Return the response value for the key.
+
+        :param key: The response value to get, one of 'ack' or 'result'.
+        :type key: str
+        :param default: The value to return if the key is not a response value.
+        :type default: any
+
+        :return: The response value.
+        :rtype: any
+        """
+
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def set_result(self, *result):
+        """
+        Set the response result and mark the response as acknowledged.
+
+        This method is passed as the callback to the socketio emit method. The result is the
+        return value of the api request.
+        """
+
+        if len(result) == 1:
+            self.result = result[0]
+        else:
+            self.result = result
+        self.ack = True
+        self.event.set()
@@ -8,13 +8,14 @@
 # agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
 # not expressly granted therein are reserved by Autodesk, Inc.
 
+from collections import OrderedDict
+from concurrent.futures import Future
 from typing import Optional
 
-import inspect
 import threading
 import types
 
-from ..utils.exceptions import AliasClientNotFound
+from ..utils.exceptions import AliasClientBatchRequestError, AliasClientNotFound
 
 
 class AliasClientObjectProxyWrapper:
@@ -28,16 +29,41 @@ class AliasClientObjectProxyWrapper:
 
     # Store any Alias modules that have been created on the client side (here) that exist on
     # the server side. Currently there should only ever be one module, the 'alias_api', but in
-    # the future there could be more api modules to add here.
-    __modules = {}
+    # the future there could be more api modules to add here. The registry is bounded, the
+    # oldest module stored (and its types) are removed once the max size is exceeded. The lock
+    # is only needed to modify the registry, modules are looked up without it.
+    __modules = OrderedDict()
     __module_lock = threading.Lock()
+    __max_modules = 8
 
     # Store any Alias types that have been created on the client side (here), so that these
     # types do not need to be created each time the client recieves an object, as well as
-    # then being able to compare object types for equality
+    # then being able to compare object types for equality. Like the modules, the lock is only
+    # needed to modify the registry, types are looked up without it.
     __types_by_module = {}
     __types_by_module_lock = threading.Lock()
 
+    # The proxy wrapper subclasses by the set of data keys they require, to look up the class
+    # to create a proxy for data received from the server.
+    __proxy_classes_by_data = {}
+    __max_required_data_len = 0
+
+    # Type tag to identify proxy wrapper objects, which is cheaper to check than isinstance
+    # when building the attributes for modules and classes with many members.
+    _alias_proxy_wrapper = True
+
+    # Declare the instance attributes to reduce the memory footprint of the many proxy objects
+    # created. The dynamic Alias types created from the proxy classes do not define slots, so
+    # their instances still allow setting arbitrary attributes.
+    __slots__ = (
+        "__data",
+        "__module",
+        "__attribute_name",
+        "__plain_members",
+        "__proxy_members",
+        "__weakref__",
+    )
+
     def __init__(self, data, module=None, attribute_name=None):
         """Initialize the proxy wrapper object."""
 
@@ -52,8 +78,32 @@ class AliasClientObjectProxyWrapper:
         self.__attribute_name = attribute_name
 
         # If this wrapper represents a module or class object, these are the memebrs of the
-        # module or class as a JSON object.
-        self.__members = data.get("__members__") or []
+        # module or class as a JSON object. The members are split once on decode into plain
+        # values and proxy wrappers (which need to create their object), so that building the
+        # attributes does not need to check each member.
+        self.__plain_members = []
+        self.__proxy_members = []
+        for member in data.get("__members__") or []:
+            if getattr(member[1], "_alias_proxy_wrapper", False):
+                self.__proxy_members.append(member)
+            else:
+                self.__plain_members.append(member)
+
+    def __init_subclass__(cls, **kwargs):
+        """Register the subclass to create proxies for the data it requires."""
+
+        super(AliasClientObjectProxyWrapper, cls).__init_subclass__(**kwargs)
+
+        # Only register the classes that define their required data, and not the Alias types
+        # that are dynamically created from them.
+        if "_REQUIRED_DATA" in cls.__dict__:
+            AliasClientObjectProxyWrapper.__proxy_classes_by_data[
+                cls._REQUIRED_DATA
+            ] = cls
+            AliasClientObjectProxyWrapper.__max_required_data_len = max(
+                AliasClientObjectProxyWrapper.__max_required_data_len,
+                len(cls._REQUIRED_DATA),
+            )
 
     # -------------------------------------------------------------------------------------------------------
     # Class methods
@@ -62,8 +112,7 @@ class AliasClientObjectProxyWrapper:
     def get_module(cls, module_name):
         """Return the module for the given name."""
 
-        with cls.__module_lock:
-            return cls.__modules.get(module_name)
+        return cls.__modules.get(module_name)
 
     @classmethod
     def store_module(cls, module_name, module):
@@ -71,33 +120,75 @@ class AliasClientObjectProxyWrapper:
 
         with cls.__module_lock:
             cls.__modules[module_name] = module
+            cls.__modules.move_to_end(module_name)
+            while len(cls.__modules) > cls.__max_modules:
+                evicted_module_name, _ = cls.__modules.popitem(last=False)
+                with cls.__types_by_module_lock:
+                    cls.__types_by_module.pop(evicted_module_name, None)
+
+    @classmethod
+    def invalidate_module(cls, module_name):
+        """
+        Remove the module and its types from the registry.
+
+        The next time the module is requested, it will be re-created from the proxy data.
+
+        :param module_name: The name of the module to remove.
+        :type module_name: str
+        """
+
+        with cls.__module_lock:
+            cls.__modules.pop(module_name, None)
+            with cls.__types_by_module_lock:
+                cls.__types_by_module.pop(module_name, None)
+
+    @classmethod
+    def invalidate_all(cls):
+        """Remove all modules and types from the registry."""
+
+        with cls.__module_lock:
+            cls.__modules.clear()
+            with cls.__types_by_module_lock:
+                cls.__types_by_module.clear()
 
     @classmethod
     def get_proxy_type(cls, module_name, type_name):
         """Return the type for the given module and type name."""
 
-        with cls.__types_by_module_lock:
-            return cls.__types_by_module.get(module_name, {}).get(type_name)
+        types_by_name = cls.__types_by_module.get(module_name)
+        if types_by_name is None:
+            return None
+        return types_by_name.get(type_name)
 
     @classmethod
     def store_type(cls, module_name, type_name, type_obj):
-        """Store the type in the registry by the given module and type name."""
+        """
+        Store the type in the registry by the given module and type name.
+
+        If another thread already stored a type for the name, that type is kept, so that all
+        objects of the same Alias type share one type object.
+
+        :return: The type stored in the registry for the given module and type name.
+        :rtype: type
+        """
 
         with cls.__types_by_module_lock:
-            cls.__types_by_module.setdefault(module_name, {})[type_name] = type_obj
+            return cls.__types_by_module.setdefault(module_name, {}).setdefault(
+                type_name, type_obj
+            )
 
     @classmethod
     def required_data(cls):
         """
-        Abstract class method.
-
         Return the set of required data dictionary keys to create an intance of this class.
 
+        Subclasses define their required data keys in the `_REQUIRED_DATA` class attribute.
+
         :return: The set of required keys.
-        :rtype: set
+        :rtype: frozenset
         """
 
-        raise NotImplementedError("Subclass must implement this method")
+        return cls._REQUIRED_DATA
 
     @classmethod
     def needs_wrapping(cls, value):
@@ -111,7 +202,7 @@ class AliasClientObjectProxyWrapper:
         :rtype: bool
         """
 
-        return cls.required_data() == set(value.keys())
+        return value.keys() == cls.required_data()
 
     @classmethod
     def create_proxy(cls, data):
@@ -127,11 +218,19 @@ class AliasClientObjectProxyWrapper:
         if not isinstance(data, dict):
             return None
 
-        for subclass in cls.__subclasses__():
-            if subclass.needs_wrapping(data):
-                return subclass._create_proxy(data)
+        # The proxy data only has dunder keys, and no more keys than the proxy class that
+        # requires the most data. Reject any other data without hashing all of its keys.
+        if not data or len(data) > cls.__max_required_data_len:
+            return None
+        first_key = next(iter(data))
+        if not isinstance(first_key, str) or not first_key.startswith("__"):
+            return None
 
-        return None
+        # Look up the subclass that requires exactly the data keys
+        subclass = cls.__proxy_classes_by_data.get(frozenset(data))
+        if subclass is None:
+            return None
+        return subclass._create_proxy(data)
 
     @classmethod
     def _create_proxy(cls, data):
@@ -186,7 +285,11 @@ class AliasClientObjectProxyWrapper:
         :rtype: Any
         """
 
-        self._init(module, object_name)
+        # Initialize the proxy wrapper object for the given module. At the time of creating the
+        # proxy, the attribute name is not available. It is only known once the module calls
+        # to create it the attribute from this proxy object.
+        self.__module = module
+        self.__attribute_name = object_name
         return self._create_object()
 
     def sanitize(self):
@@ -197,20 +300,6 @@ class AliasClientObjectProxyWrapper:
     # -------------------------------------------------------------------------------------------------------
     # Protected methods
 
-    def _init(self, module, attribute_name):
-        """
-        Initialize the proxy wrapper object for the given module.
-
-        This must be called before the object can be created from the proxy (e.g. _create_object).
-        """
-
-        self.__module = module
-
-        # Initialize the attribute name for this proxy object. At the time of creating the
-        # proxy, the attribute name is not available. It is only known once the module calls
-        # to create it the attribute from this proxy object.
-        self.__attribute_name = attribute_name
-
     def _create_object(self):
         """
         Create an object from the proxy data to represent an Alias data object.
@@ -227,14 +316,14 @@ class AliasClientObjectProxyWrapper:
     def _get_attributes(self):
         """Return a dictionary of attribtues for this object."""
 
-        attrs = {}
-
-        for attr_name, attr_data in self.__members:
-            if isinstance(attr_data, AliasClientObjectProxyWrapper):
-                attrs[attr_name] = attr_data.create_object(self.module, attr_name)
-            else:
-                attrs[attr_name] = attr_data
-
+        module = self.module
+        attrs = dict(self.__plain_members)
+        attrs.update(
+            {
+                attr_name: attr_data.create_object(module, attr_name)
+                for attr_name, attr_data in self.__proxy_members
+            }
+        )
         return attrs
 
 
@@ -256,6 +345,25 @@ class AliasClientModuleProxyWrapper(AliasClientObjectProxyWrapper):
     socketio call to retrieve the data from the server, which makes the actual api request.
     """
 
+    __slots__ = (
+        "__module_name",
+        "__sio",
+        "__batch_mode",
+        "__batch_requests",
+        "__batch_futures",
+    )
+
+    # The set of required data dictionary keys to create an instance of this class.
+    _REQUIRED_DATA = frozenset(
+        (
+            "__module_name__",
+            "__members__",
+        )
+    )
+
+    # The argument types that are passed to the server as callback functions
+    __FUNCTION_TYPES = (types.FunctionType, types.MethodType)
+
     def __init__(self, module_data):
         """Initialize"""
 
@@ -265,25 +373,7 @@ class AliasClientModuleProxyWrapper(AliasClientObjectProxyWrapper):
         self.__sio = None
         self.__batch_mode = False
         self.__batch_requests = []
-
-    # -------------------------------------------------------------------------------------------------------
-    # Class methods
-
-    @classmethod
-    def required_data(cls):
-        """
-        Return the set of required data dictionary keys to create an intance of this class.
-
-        :return: The set of required keys.
-        :rtype: set
-        """
-
-        return set(
-            [
-                "__module_name__",
-                "__members__",
-            ]
-        )
+        self.__batch_futures = []
 
     # -------------------------------------------------------------------------------------------------------
     # Properties
@@ -327,7 +417,13 @@ class AliasClientModuleProxyWrapper(AliasClientObjectProxyWrapper):
             # Create the new module, and set its attributes
             module = types.ModuleType(self.__module_name)
 
+            # Build all attributes up front, and add them to the module dict at once. Define
+            # the public names of the module (if not given by the server), to match a
+            # star-import of the original module.
             module_attrs = self._get_attributes()
+            module_attrs.setdefault(
+                "__all__", [name for name in module_attrs if not name.startswith("_")]
+            )
             module.__dict__.update(module_attrs)
 
             # Store the module
@@ -343,40 +439,75 @@ class AliasClientModuleProxyWrapper(AliasClientObjectProxyWrapper):
         the server, to access Alias data. It will make the api request using the socketio
         communication.
 
+        In batch mode, the request is not sent, and a Future is returned instead of the
+        request result. The api functions and properties of the module return this Future to
+        the caller. The Future is resolved once the batched requests are executed (see
+        `batch_requests`).
+
         :param request_name: The api request name (e.g. function name)
         :type request_name: str
         :param request_data: The api request payload
         :typ request_data: dict
 
-        :return: The return value of executing the api request.
-        :rtype: Any
+        :return: The return value of executing the api request, or a Future in batch mode.
+        :rtype: Any | concurrent.futures.Future
         """
 
-        if not self.sio:
-            raise AliasClientNotFound(
-                "Alias client not found. Cannot send api request."
-            )
+        if self.batch_mode:
+            return self.send_request_async(request_name, request_data)
 
-        # Sanitize special case arguments before passing to api request.
-        if request_data:
-            if "__function_args__" in request_data:
-                args = []
-                for arg in request_data.get("__function_args__", []):
-                    args.append(self.__sanitize_arg(arg))
-                request_data["__function_args__"] = args
-
-            if "__function_kwargs__" in request_data:
-                kwargs = {}
-                for name, arg in request_data.get("__function_kwargs__", {}).items():
-                    kwargs[name] = self.__sanitize_arg(arg)
-                request_data["__function_kwargs__"] = kwargs
+        self.__sanitize_request_data(request_data)
+
+        # Emit non-blocking GUI request (to avoid deadlocks with Alias) and wait for the event result.
+        return self.sio.emit_threadsafe_and_wait(request_name, request_data)
+
+    def send_request_async(self, request_name, request_data):
+        """
+        Send an api request to the server, without waiting for the result.
+
+        Use this to send multiple independent requests, and then wait for all of them at once
+        with `wait_for_requests`, instead of waiting for each request in turn, e.g.
+
+            futures = [alias_api_module.send_request_async(...) for ...]
+            results = alias_api_module.wait_for_requests(futures)
+
+        In batch mode, the request is deferred until the batched requests are executed.
+
+        :param request_name: The api request name (e.g. function name)
+        :type request_name: str
+        :param request_data: The api request payload
+        :typ request_data: dict
+
+        :return: A Future that will be resolved with the api request result.
+        :rtype: concurrent.futures.Future
+        """
+
+        self.__sanitize_request_data(request_data)
 
         if self.batch_mode:
             # Defer and store the request to send multiple requests at once
+            future = Future()
             self.__batch_requests.append((request_name, request_data))
-            return
-        # Emit non-blocking GUI request (to avoid deadlocks with Alias) and wait for the event result.
-        return self.sio.emit_threadsafe_and_wait(request_name, request_data)
+            self.__batch_futures.append(future)
+            return future
+        return self.sio.emit_threadsafe_async(request_name, request_data)
+
+    def wait_for_requests(self, futures):
+        """
+        Wait for the api requests sent with `send_request_async` and return their results.
+
+        :param futures: The Futures returned by `send_request_async`.
+        :type futures: List[concurrent.futures.Future]
+
+        :return: The api request results, in the same order as the Futures given.
+        :rtype: list
+        """
+
+        if not self.sio:
+            raise AliasClientNotFound(
+                "Alias client not found. Cannot wait for api requests."
+            )
+        return self.sio.wait_for_futures(futures)
 
     def batch_requests(
         self, start: Optional[bool] = True, is_async: Optional[bool] = False
@@ -390,31 +521,90 @@ class AliasClientModuleProxyWrapper(AliasClientObjectProxyWrapper):
         them all at once.
 
         On stopping batch requests, the batched requests will be sent to the
-        server.
+        server, and the Future objects returned for each batched request will be
+        resolved with their result. If the number of results does not match the
+        number of requests, the Future objects are set with an
+        AliasClientBatchRequestError. When executing async, the Future objects are
+        cancelled, since no result is returned.
 
         :param start: True to start batching requests, False to stop.
         :param is_async: True to return immediately without waiting  for the
             request to return with a result, False to wait and return the result
             of the batched requests. This is only used when stopping batch
             mode and executing the requests.
+
+        :return: The results of the batched requests, when stopping batch mode and waiting
+            for the result, else None.
+        :rtype: list | None
         """
 
         self.__batch_mode = start
 
         if not self.__batch_mode:
+            futures = self.__batch_futures
             try:
                 if is_async:
                     self.sio.emit_threadsafe("batch_requests", self.__batch_requests)
-                else:
-                    return self.sio.emit_threadsafe_and_wait(
-                        "batch_requests", self.__batch_requests
+                    for future in futures:
+                        future.cancel()
+                    return
+
+                result = self.sio.emit_threadsafe_and_wait(
+                    "batch_requests", self.__batch_requests
+                )
+                if result is None or len(result) != len(futures):
+                    error = AliasClientBatchRequestError(
+                        f"Expected {len(futures)} results, but got {result}."
                     )
+                    for future in futures:
+                        future.set_exception(error)
+                else:
+                    for future, value in zip(futures, result):
+                        future.set_result(value)
+                return result
+            except Exception as error:
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(error)
+                raise
             finally:
                 self.__batch_requests = []
+                self.__batch_futures = []
 
     # -------------------------------------------------------------------------------------------------------
     # Private methods
 
+    def __sanitize_request_data(self, request_data):
+        """
+        Sanitize the api request data before sending the request.
+
+        :param request_data: The api request payload, which is modified in place.
+        :type request_data: dict
+        """
+
+        if not self.sio:
+            raise AliasClientNotFound(
+                "Alias client not found. Cannot send api request."
+            )
+
+        # Sanitize special case arguments before passing to api request. Only functions need
+        # sanitizing, so the arguments are left as is if there are none.
+        if request_data:
+            function_types = self.__FUNCTION_TYPES
+            sanitize_arg = self.__sanitize_arg
+
+            args = request_data.get("__function_args__")
+            if args and any(isinstance(arg, function_types) for arg in args):
+                request_data["__function_args__"] = [sanitize_arg(arg) for arg in args]
+
+            kwargs = request_data.get("__function_kwargs__")
+            if kwargs and any(
+                isinstance(arg, function_types) for arg in kwargs.values()
+            ):
+                request_data["__function_kwargs__"] = {
+                    name: sanitize_arg(arg) for name, arg in kwargs.items()
+                }
+
     def __sanitize_arg(self, arg):
         """
         Sanitize the argument before passing it as an api request argument.
@@ -435,13 +625,11 @@ class AliasClientModuleProxyWrapper(AliasClientObjectProxyWrapper):
         :type arg: Any
         """
 
-        if inspect.isfunction(arg) or inspect.ismethod(arg):
+        if isinstance(arg, self.__FUNCTION_TYPES):
             # Generate a unique id for functions to pass in the api request, so that when it
-            # is invoked, we can look it up by the id to.
-            if self.sio.has_callback(arg):
-                callback_id = self.sio.get_callback_id(arg)
-            else:
-                callback_id = self.sio.set_callback(arg)
+            # is invoked, we can look it up by the id to. Registering the callback is a no-op
+            # if it is already registered.
+            callback_id = self.sio.set_callback(arg)
 
             # Return a dictionary specific to describing a callback function.
             return {"__callback_function_id__": callback_id}
@@ -453,6 +641,20 @@ class AliasClientModuleProxyWrapper(AliasClientObjectProxyWrapper):
 class AliasClientPropertyProxyWrapper(AliasClientObjectProxyWrapper):
     """A proxy wrapper for Alias api intance properties."""
 
+    __slots__ = ("__payload",)
+
+    # The set of required data dictionary keys to create an instance of this class.
+    _REQUIRED_DATA = frozenset(("__property_name__",))
+
+    def __init__(self, data):
+        """Initialize"""
+
+        super(AliasClientPropertyProxyWrapper, self).__init__(data)
+
+        # The request data template, with the property name from the proxy data until the
+        # property attribute name is set (see `_create_object`).
+        self.__payload = {"__property_name__": data["__property_name__"]}
+
     def __get__(self, instance, owner):
         """
         Override this method to redirect the property get method.
@@ -461,11 +663,9 @@ class AliasClientPropertyProxyWrapper(AliasClientObjectProxyWrapper):
         since the object of this property lives on the server.
         """
 
-        data = {
-            "__instance_id__": instance.unique_id,
-            "__property_name__": self.attribute_name,
-        }
-        return self.module.send_request(self.attribute_name, data)
+        data = self.__payload.copy()
+        data["__instance_id__"] = instance.unique_id
+        return self.module.send_request(data["__property_name__"], data)
 
     def __set__(self, instance, value):
         """
@@ -475,35 +675,43 @@ class AliasClientPropertyProxyWrapper(AliasClientObjectProxyWrapper):
         since the object of this property lives on the server.
         """
 
-        data = {
-            "__instance_id__": instance.unique_id,
-            "__property_name__": self.attribute_name,
-            "__property_value__": value,
-        }
-        return self.module.send_request(self.attribute_name, data)
+        data = self.__payload.copy()
+        data["__instance_id__"] = instance.unique_id
+        data["__property_value__"] = value
+        return self.module.send_request(data["__property_name__"], data)
 
     # -------------------------------------------------------------------------------------------------------
-    # Class methods
+    # Protected methods
 
-    @classmethod
-    def required_data(cls):
+    def _create_object(self):
         """
-        Return the set of required data dictionary keys to create an intance of this class.
+        Override the base class method.
 
-        :return: The set of required keys.
-        :rtype: set
+        Set the property attribute name in the request data template. The template is copied
+        for each property get and set request, and only the values that change for each
+        request are set.
+
+        :return: This property proxy wrapper object.
+        :rtype: AliasClientPropertyProxyWrapper
         """
 
-        return set(
-            [
-                "__property_name__",
-            ]
-        )
+        self.__payload = {"__property_name__": self.attribute_name}
+        return self
 
 
 class AliasClientFunctionProxyWrapper(AliasClientObjectProxyWrapper):
     """A proxy wrapper for Alias api functions."""
 
+    __slots__ = ("__func_name", "__is_instance_method", "__callable")
+
+    # The set of required data dictionary keys to create an instance of this class.
+    _REQUIRED_DATA = frozenset(
+        (
+            "__function_name__",
+            "__is_method__",
+        )
+    )
+
     def __init__(self, data):
         """Initialize"""
 
@@ -511,60 +719,57 @@ class AliasClientFunctionProxyWrapper(AliasClientObjectProxyWrapper):
 
         self.__func_name = data.get("__function_name__")
         self.__is_instance_method = data.get("__is_method__", False)
-
-    @classmethod
-    def required_data(cls):
-        """
-        Return the set of required data dictionary keys to create an intance of this class.
-
-        :return: The set of required keys.
-        :rtype: set
-        """
-
-        return set(
-            [
-                "__function_name__",
-                "__is_method__",
-            ]
-        )
+        self.__callable = None
 
     def _create_object(self):
         """
         Create a function from the proxy data to represent a function in the Alias api.
 
+        The function is created once and reused, since it looks up the module and function
+        name from this proxy wrapper when it is called.
+
         :return: The function object.
         :rtype: function
         """
 
-        if self.__is_instance_method:
-            return self.__get_method()
-        return self.__get_function()
+        if self.__callable is None:
+            if self.__is_instance_method:
+                self.__callable = self.__get_method()
+            else:
+                self.__callable = self.__get_function()
+        return self.__callable
 
     def __get_method(self):
         """
         Return a function that acts as a method that sends an api request from the proxy data."""
 
+        # The request data is copied from a template with the function name, and only the
+        # values that change for each call are set.
+        func_name = self.__func_name
+        payload = {"__function_name__": func_name}
+
         def __method(instance, *args, **kwargs):
-            data = {
-                "__instance_id__": instance.unique_id,
-                "__function_name__": self.__func_name,
-                "__function_args__": args,
-                "__function_kwargs__": kwargs,
-            }
-            return self.module.send_request(self.__func_name, data)
+            data = payload.copy()
+            data["__instance_id__"] = instance.unique_id
+            data["__function_args__"] = args
+            data["__function_kwargs__"] = kwargs
+            return self.module.send_request(func_name, data)
 
         return __method
 
     def __get_function(self):
         """Return a function that sends an api request from the proxy data."""
 
+        # The request data is copied from a template with the function name, and only the
+        # values that change for each call are set.
+        func_name = self.__func_name
+        payload = {"__function_name__": func_name}
+
         def __function(*args, **kwargs):
-            data = {
-                "__function_name__": self.__func_name,
-                "__function_args__": args,
-                "__function_kwargs__": kwargs,
-            }
-            return self.module.send_request(self.__func_name, data)
+            data = payload.copy()
+            data["__function_args__"] = args
+            data["__function_kwargs__"] = kwargs
+            return self.module.send_request(func_name, data)
 
         return __function
 
@@ -572,48 +777,58 @@ class AliasClientFunctionProxyWrapper(AliasClientObjectProxyWrapper):
 class AliasClientClassProxyWrapper(AliasClientObjectProxyWrapper):
     """A proxy wrapper for Alias api classes."""
 
+    __slots__ = ("__class_name", "__class_type")
+
+    # The set of required data dictionary keys to create an instance of this class.
+    _REQUIRED_DATA = frozenset(
+        (
+            "__module_name__",
+            "__class_name__",
+            "__members__",
+        )
+    )
+
     def __init__(self, data):
         """Initialize"""
 
         super(AliasClientClassProxyWrapper, self).__init__(data)
 
-        self.__class_name = self.data["__class_name__"]
-
-    @classmethod
-    def required_data(cls):
-        """
-        Return the set of required data dictionary keys to create an intance of this class.
-
-        :return: The set of required keys.
-        :rtype: set
-        """
-
-        return set(
-            [
-                "__module_name__",
-                "__class_name__",
-                "__members__",
-            ]
-        )
+        self.__class_name = data["__class_name__"]
+        self.__class_type = None
 
     def _create_object(self):
         """
         Create an object from the proxy data to represent a class type in Alias api.
 
         Inspect the data to create and return the Alias api class type, as a subclass
-        of this class.
+        of this class. The class type is created once and reused, so that its attributes
+        are not created again, and the same type is returned each time.
 
         :return: The class type object.
         :rtype: AliasClientClassProxyWrapper
         """
 
-        class_attrs = self._get_attributes()
-        return type(self.__class_name, (self.__class__,), class_attrs)
+        if self.__class_type is None:
+            class_attrs = self._get_attributes()
+            self.__class_type = type(self.__class_name, (self.__class__,), class_attrs)
+        return self.__class_type
 
 
 class AliasClientEnumProxyWrapper(AliasClientObjectProxyWrapper):
     """A proxy wrapper for Alias enum objects."""
 
+    __slots__ = ("__name", "__value", "__hash")
+
+    # The set of required data dictionary keys to create an instance of this class.
+    _REQUIRED_DATA = frozenset(
+        (
+            "__module_name__",
+            "__class_name__",
+            "__enum_name__",
+            "__enum_value__",
+        )
+    )
+
     def __init__(self, data):
         """Initialize the enum object."""
 
@@ -622,6 +837,10 @@ class AliasClientEnumProxyWrapper(AliasClientObjectProxyWrapper):
         self.__name = data.get("__enum_name__")
         self.__value = data.get("__enum_value__")
 
+        # The enum type and value do not change, so the hash is computed once, since enums are
+        # commonly used as dictionary keys.
+        self.__hash = hash((self.__class__, self.__value))
+
     def __str__(self):
         """Return the string representation of the enum object."""
 
@@ -641,8 +860,8 @@ class AliasClientEnumProxyWrapper(AliasClientObjectProxyWrapper):
         within Toolkit (e.g. before socket communication).
         """
 
-        if type(other) == type(self):
-            return self.value == other.value
+        if type(other) is type(self):
+            return self.__value == other.__value
         return False
 
     def __hash__(self):
@@ -652,29 +871,10 @@ class AliasClientEnumProxyWrapper(AliasClientObjectProxyWrapper):
         With override the equality operator, we must not override the hash function to allow
         enum objects to still be hashable.
 
-        Generate a unique hash value based on the enum type and value.
+        Return the unique hash value based on the enum type and value.
         """
 
-        tuple_value = (self.__class__, self.value)
-        return hash(tuple_value)
-
-    @classmethod
-    def required_data(cls):
-        """
-        Return the set of required data dictionary keys to create an intance of this class.
-
-        :return: The set of required keys.
-        :rtype: set
-        """
-
-        return set(
-            [
-                "__module_name__",
-                "__class_name__",
-                "__enum_name__",
-                "__enum_value__",
-            ]
-        )
+        return self.__hash
 
     @classmethod
     def _create_proxy(cls, data):
@@ -695,8 +895,9 @@ class AliasClientEnumProxyWrapper(AliasClientObjectProxyWrapper):
         enum_class_name = data["__class_name__"]
         enum_type = cls.get_proxy_type(enum_module_name, enum_class_name)
         if not enum_type:
-            enum_type = type(enum_class_name, (cls,), {})
-            cls.store_type(enum_module_name, enum_class_name, enum_type)
+            enum_type = cls.store_type(
+                enum_module_name, enum_class_name, type(enum_class_name, (cls,), {})
+            )
 
         return enum_type(data)
 
@@ -714,13 +915,27 @@ class AliasClientEnumProxyWrapper(AliasClientObjectProxyWrapper):
 class AliasClientObjectProxy(AliasClientObjectProxyWrapper):
     """A proxy wrapper for intances of Alias objects."""
 
+    # The unique id is a plain attribute, rather than a property, since it is read for every
+    # property and method request on the object.
+    __slots__ = ("unique_id", "__dict", "__name_dirty")
+
+    # The set of required data dictionary keys to create an instance of this class.
+    _REQUIRED_DATA = frozenset(
+        (
+            "__module_name__",
+            "__class_name__",
+            "__instance_id__",
+            "__dict__",
+        )
+    )
+
     def __init__(self, data):
         """Initialize"""
 
         super(AliasClientObjectProxy, self).__init__(data)
 
-        self.__unique_id = self.data["__instance_id__"]
-        self.__dict = self.data["__dict__"]
+        self.unique_id = data["__instance_id__"]
+        self.__dict = data["__dict__"]
         self.__name_dirty = False
 
     def __str__(self):
@@ -735,24 +950,6 @@ class AliasClientObjectProxy(AliasClientObjectProxyWrapper):
         """Return the string representation of the object."""
         return f"<{self.__class__.__name__}: {self.name}>"
 
-    @classmethod
-    def required_data(cls):
-        """
-        Return the set of required data dictionary keys to create an intance of this class.
-
-        :return: The set of required keys.
-        :rtype: set
-        """
-
-        return set(
-            [
-                "__module_name__",
-                "__class_name__",
-                "__instance_id__",
-                "__dict__",
-            ]
-        )
-
     @classmethod
     def _create_proxy(cls, data):
         """
@@ -770,39 +967,34 @@ class AliasClientObjectProxy(AliasClientObjectProxyWrapper):
         """
 
         proxy_module_name = data["__module_name__"]
-        module = AliasClientObjectProxyWrapper.get_module(proxy_module_name)
-        if not module:
-            raise Exception("Module not found")
         proxy_type_name = data["__class_name__"]
         proxy_type = cls.get_proxy_type(proxy_module_name, proxy_type_name)
         if not proxy_type:
+            # The module is only needed to create the type. The types of a module are removed
+            # with the module, so a type found above always belongs to a stored module.
+            module = AliasClientObjectProxyWrapper.get_module(proxy_module_name)
+            if not module:
+                raise Exception("Module not found")
             lookup_type = getattr(module, proxy_type_name)
-            proxy_attributes = lookup_type.__dict__
 
             # Skip any private members, and modify any attributes that conflict
             # with the proxy class. The proxy class may want to override the
             # attribute to provide additional functionality.
-            modified_attributes = {}
-            for attr_name, attr_value in proxy_attributes.items():
-                if attr_name.startswith("__"):
-                    continue
-                if hasattr(cls, attr_name):
-                    modified_attr_name = f"_{attr_name}"
-                    modified_attributes[modified_attr_name] = attr_value
-                else:
-                    modified_attributes[attr_name] = attr_value
+            modified_attributes = {
+                (f"_{attr_name}" if hasattr(cls, attr_name) else attr_name): attr_value
+                for attr_name, attr_value in lookup_type.__dict__.items()
+                if not attr_name.startswith("__")
+            }
 
-            proxy_type = type(proxy_type_name, (cls,), modified_attributes)
-            cls.store_type(proxy_module_name, proxy_type_name, proxy_type)
+            proxy_type = cls.store_type(
+                proxy_module_name,
+                proxy_type_name,
+                type(proxy_type_name, (cls,), modified_attributes),
+            )
 
         # Return an actual instance of the proxy type, not just the type object (like other classes do)
         return proxy_type(data)
 
-    @property
-    def unique_id(self):
-        """Return the unique id for this object."""
-        return self.__unique_id
-
     @property
     def name(self):
         """
@@ -814,7 +1006,7 @@ class AliasClientObjectProxy(AliasClientObjectProxyWrapper):
         return the updated name. To get the updated name, the object must be
         queried from the server again.
         """
-        attr_name = inspect.currentframe().f_code.co_name
+        attr_name = "name"
         if self.__name_dirty:
             # Query the server to get the property name
             modified_attr_name = f"_{attr_name}"
@@ -825,8 +1017,8 @@ class AliasClientObjectProxy(AliasClientObjectProxyWrapper):
 
     @name.setter
     def name(self, value):
-        # Get this property name from the calling method
-        attr_name = inspect.currentframe().f_code.co_name
+        # This property name
+        attr_name = "name"
         # Get the modified property name, to call the original property setter
         # method
         modified_attr_name = f"_{attr_name}"
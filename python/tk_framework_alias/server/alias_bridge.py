@@ -56,8 +56,9 @@ class AliasBridge(metaclass=Singleton):
         self.__max_retry_count = 25
         self.__server_socket = None
 
-        # Track the clients registered to the socketio server
+        # Track the clients registered to the socketio server, by name and by namespace
         self.__clients = {}
+        self.__clients_by_namespace = {}
 
         # The Alias data model to store Alias api objects, to allow passing api objects back
         # and forth between the server and its clients.
@@ -69,7 +70,7 @@ class AliasBridge(metaclass=Singleton):
             self.__class__.__name__, "sio_server"
         )
         self.__server_sio = socketio.Server(
-            aysnc_mode="eventlet",
+            async_mode="eventlet",
             logger=server_sio_logger,
             engineio_logger=server_sio_logger,
             ping_timeout=60 * 5,
@@ -164,10 +165,13 @@ class AliasBridge(metaclass=Singleton):
         th.start()
 
         # Connect the Alias socketio client to the server. This must be called after the server has started.
+        # Use the websocket transport directly, instead of starting with long-polling and
+        # upgrading, since the server is in this process.
         server_host, server_port = self.__server_socket.getsockname()
         self.alias_events_client_sio.connect(
             f"http://{server_host}:{server_port}",
             namespaces=[AliasEventsServerNamespace.get_namespace()],
+            transports=["websocket"],
             wait_timeout=20,
         )
 
@@ -206,6 +210,7 @@ class AliasBridge(metaclass=Singleton):
 
         # Clean up the clients
         self.__clients.clear()
+        self.__clients_by_namespace.clear()
 
     def get_client_by_namespace(self, namespace):
         """
@@ -218,14 +223,7 @@ class AliasBridge(metaclass=Singleton):
         :rtype: dict
         """
 
-        return next(
-            (
-                client_data
-                for client_data in self.__clients.values()
-                if client_data["namespace"] == namespace
-            ),
-            {},
-        )
+        return self.__clients_by_namespace.get(namespace, {})
 
     def register_client_namespace(self, client_name, client_info):
         """
@@ -270,6 +268,7 @@ class AliasBridge(metaclass=Singleton):
             "namespace": namespace_handler.namespace,
         }
         self.__clients[client_name] = client
+        self.__clients_by_namespace[namespace_handler.namespace] = client
 
         return client
 
@@ -10,7 +10,6 @@
 
 import filecmp
 import logging
-import json
 import pprint
 import os
 import shutil
@@ -236,21 +235,32 @@ class AliasServerNamespace(socketio.Namespace):
         cache_module_filename = f"{base_cache_module_filename}.{api_ext}"
         cache_module_filepath = os.path.join(cache_dir, cache_module_filename)
 
-        # Check if the cache is up-to-date. If not, create a new cache
+        # Check if the cache is up-to-date. If not, create a new cache. The copy of the module
+        # keeps the modified time of the module, so that the files are compared by their size
+        # and modified time only, and are not read unless the module has changed.
         if (
             not os.path.exists(cache_filepath)
             or not os.path.exists(cache_module_filepath)
             or not filecmp.cmp(api_info["file_path"], cache_module_filepath)
         ):
             # Ensure the cache directory exists
-            if not os.path.exists(cache_dir):
-                os.makedirs(cache_dir)
-            # Create the Alias API cache
-            with open(cache_filepath, "w") as fp:
-                json.dump(alias_api, fp=fp, cls=AliasServerJSON.encoder_class())
-            # Copy the module to the cache folder in order to determine next time if the
-            # cache requies an update
-            shutil.copyfile(api_info["file_path"], cache_module_filepath)
+            os.makedirs(cache_dir, exist_ok=True)
+            # Create the Alias API cache. Encode the module in one pass and write it at once,
+            # json.dump would encode it with the pure Python encoder in many small writes.
+            with open(cache_filepath, "wb") as fp:
+                fp.write(AliasServerJSON.dumps(alias_api).encode("utf-8"))
+            # Copy the module (and its modified time) to the cache folder in order to
+            # determine next time if the cache requies an update
+            shutil.copy2(api_info["file_path"], cache_module_filepath)
+        elif (
+            os.stat(api_info["file_path"]).st_mtime
+            != os.stat(cache_module_filepath).st_mtime
+        ):
+            # The module is unchanged, but its copy does not have the module modified time
+            # (e.g. the copy was made before copying the modified time), so the files were
+            # compared by their contents. Set the modified time on the copy, so that the next
+            # check only compares the file stats.
+            shutil.copystat(api_info["file_path"], cache_module_filepath)
 
         # Return the path to the Alias API cache file
         return cache_filepath
@@ -17,7 +17,6 @@ import shutil
 import zipfile
 import pprint
 import subprocess
-import zipfile
 
 from . import environment_utils
 from .utils import version_cmp, encrypt_to_str, verify_file
@@ -189,7 +188,7 @@ def __ensure_toolkit_plugin_up_to_date(logger):
     alias_plugin_dir = environment_utils.get_alias_plugin_dir()
     logger.debug(f"Alias plugin directory: {alias_plugin_dir}")
     if not os.path.exists(alias_plugin_dir):
-        logger.debug(f"Alias plugin directory does not exist - creating it.")
+        logger.debug("Alias plugin directory does not exist - creating it.")
         ensure_folder_exists(alias_plugin_dir)
 
     # Get the path to the pre-built plugin from the framework
@@ -572,8 +571,7 @@ def __ensure_python_qt_extension_packages_installed(python_version=None, logger=
                 shutil.rmtree(install_qt_ext_path)
 
             install_qt_ext_dir = os.path.dirname(install_qt_ext_path)
-            if not os.path.exists(install_qt_ext_dir):
-                os.makedirs(install_qt_ext_dir)
+            os.makedirs(install_qt_ext_dir, exist_ok=True)
 
             # Copy the zip folder. This will be used to check if updates are needed based on file
             # modifiation timestamp
@@ -598,8 +596,7 @@ def __ensure_python_packages_up_to_date(
     )
     lib_dir = os.path.join(os.path.dirname(python_exe), "Lib")
     dist_dir = os.path.join(lib_dir, "site-packages")
-    if not os.path.exists(dist_dir):
-        os.mkdir(dist_dir)
+    os.makedirs(dist_dir, exist_ok=True)
     logger.debug(f"Ensuring python packages up to date in {dist_dir}...")
 
     # Pip install everything and capture everything that was installed.
@@ -0,0 +1,157 @@
+# Copyright (c) 2024 Autodesk Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk Inc.
+
+import concurrent.futures
+import logging
+import pytest
+import socketio
+
+from tk_framework_alias.client.socketio.client import AliasSocketIoClient
+from tk_framework_alias.client.utils.exceptions import AliasClientNotConnected
+
+
+@pytest.fixture
+def client():
+    """
+    Return an Alias socketio client that is connected, but records the events emitted instead
+    of sending them to a server.
+    """
+
+    logger = logging.getLogger("test_client")
+    sio = AliasSocketIoClient(logger=logger, engineio_logger=logger)
+    sio.connected = True
+    sio.emitted = []
+    sio.emit = lambda *args, **kwargs: sio.emitted.append((args, kwargs))
+    return sio
+
+
+####################################################################################################
+# tk_framework_alias client AliasSocketIoClient
+####################################################################################################
+
+
+def test_emit_threadsafe_async(client):
+    """Test the emit_threadsafe_async method resolves the Future with the server response."""
+
+    future = client.emit_threadsafe_async("get_layers", {"__function_name__": "a"})
+
+    assert isinstance(future, concurrent.futures.Future)
+    assert not future.done()
+    args, kwargs = client.emitted[0]
+    assert args == ("get_layers", {"__function_name__": "a"})
+
+    # The server response calls the emit callback
+    kwargs["callback"]("result")
+
+    assert future.result(0) == "result"
+
+
+def test_emit_threadsafe_async_server_error(client):
+    """Test the emit_threadsafe_async method sets the server error on the Future."""
+
+    future = client.emit_threadsafe_async("get_layers", {})
+    _, kwargs = client.emitted[0]
+    error = ValueError("Server error")
+
+    kwargs["callback"](error)
+
+    assert future.exception(0) is error
+
+
+def test_emit_threadsafe_async_not_connected(client):
+    """Test the emit_threadsafe_async method raises an error if the client is not connected."""
+
+    client.connected = False
+
+    with pytest.raises(AliasClientNotConnected):
+        client.emit_threadsafe_async("get_layers", {})
+    assert client.emitted == []
+
+
+def test_wait_for_futures(client):
+    """Test the wait_for_futures method returns the results in the order of the Futures."""
+
+    futures = [
+        client.emit_threadsafe_async("a", {}),
+        client.emit_threadsafe_async("b", {}),
+    ]
+    callback_a, callback_b = [kwargs["callback"] for _, kwargs in client.emitted]
+
+    # Respond to the second request while waiting for the first one
+    client._process_events = lambda: callback_a("a result")
+    callback_b("b result")
+
+    assert client.wait_for_futures(futures) == ["a result", "b result"]
+
+
+def test_wait_for_futures_disconnected(client):
+    """Test the wait_for_futures method raises an error if the client disconnects."""
+
+    future = client.emit_threadsafe_async("a", {})
+
+    def process_events():
+        client.connected = False
+
+    client._process_events = process_events
+
+    with pytest.raises(TimeoutError):
+        client.wait_for_futures([future])
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        (),
+        (None,),
+        ("result",),
+        ({"a": 1},),
+        ("result", 2),
+    ],
+)
+def test_call_threadsafe_matches_socketio_call(client, response):
+    """
+    Test the call_threadsafe method returns the server response as the socketio Client.call
+    method does, which call_threadsafe follows.
+    """
+
+    def emit(*args, **kwargs):
+        kwargs["callback"](*response)
+
+    client.emit = emit
+
+    expected = socketio.Client.call(client, "event", {}, timeout=1)
+    result = client.call_threadsafe("event", {}, timeout=1)
+
+    assert result == expected
+
+
+def test_call_threadsafe_emit_args(client):
+    """Test the call_threadsafe method passes the event to emit without the timeout."""
+
+    client._default_namespace = "/alias"
+
+    with pytest.raises(socketio.exceptions.TimeoutError):
+        client.call_threadsafe("event", {"a": 1}, timeout=0.01)
+
+    args, kwargs = client.emitted[0]
+    assert args == ("event", {"a": 1})
+    assert kwargs["namespace"] == "/alias"
+    assert callable(kwargs["callback"])
+    assert "timeout" not in kwargs
+
+
+def test_call_threadsafe_timeout_matches_socketio_call(client):
+    """Test the call_threadsafe method raises the same timeout error as socketio Client.call."""
+
+    with pytest.raises(socketio.exceptions.TimeoutError):
+        socketio.Client.call(client, "event", {}, timeout=0.01)
+
+    with pytest.raises(socketio.exceptions.TimeoutError):
+        client.call_threadsafe("event", {}, timeout=0.01)
@@ -8,6 +8,7 @@
 # agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
 # not expressly granted therein are reserved by Autodesk Inc.
 
+import datetime
 import pytest
 import json
 
@@ -149,6 +150,51 @@ def test_json_encode_alias_client_object_proxy():
     assert result == expected
 
 
+@pytest.mark.parametrize(
+    "value",
+    [
+        ({"a": 1, "b": [1, 2.5, None, True], "c": {"d": "e"}}),
+        ({1: "a", None: "b"}),
+        ([1, (2, 3), "\u00e9"]),
+        ({1, 2, 3}),
+        (2**70),
+        ([float("nan"), float("inf"), float("-inf")]),
+    ],
+)
+def test_json_encode_compact(value):
+    """Test the AliasClientJSON dumps method to encode compact JSON, as the socketio client does."""
+
+    result = client_json.AliasClientJSON.dumps(value, separators=(",", ":"))
+    expected = json.dumps(
+        value, cls=client_json.AliasClientJSONEncoder, separators=(",", ":")
+    )
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        (datetime.datetime(2024, 1, 1)),
+        (datetime.date(2024, 1, 1)),
+    ],
+)
+def test_json_encode_compact_not_serializable(value):
+    """Test the AliasClientJSON dumps method to encode compact JSON with unsupported types."""
+
+    with pytest.raises(TypeError):
+        client_json.AliasClientJSON.dumps([value], separators=(",", ":"))
+
+
+def test_json_encode_compact_function():
+    """Test the AliasClientJSON dumps method to encode compact JSON with function objects."""
+
+    def my_func():
+        pass
+
+    with pytest.raises(AliasClientJSONEncoderError):
+        client_json.AliasClientJSON.dumps([my_func], separators=(",", ":"))
+
+
 ####################################################################################################
 # tk_framework_alias client_json AliasClientJSONDecoder
 ####################################################################################################
@@ -0,0 +1,335 @@
+# Copyright (c) 2024 Autodesk Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk Inc.
+
+import concurrent.futures
+import inspect
+import pytest
+
+from tk_framework_alias.client.socketio import proxy_wrapper
+from tk_framework_alias.client.utils.exceptions import AliasClientBatchRequestError
+
+
+class StubClient:
+    """A stub socketio client to record the api requests sent by a module proxy."""
+
+    def __init__(self, batch_result=None, batch_error=None):
+        self.sent = []
+        self.futures = []
+        self.batch_result = batch_result
+        self.batch_error = batch_error
+
+    def emit_threadsafe_and_wait(self, request_name, request_data):
+        self.sent.append((request_name, request_data))
+        if request_name == "batch_requests":
+            if self.batch_error:
+                raise self.batch_error
+            return self.batch_result
+        return f"{request_name} result"
+
+    def emit_threadsafe(self, request_name, request_data):
+        self.sent.append((request_name, request_data))
+
+    def emit_threadsafe_async(self, request_name, request_data):
+        self.sent.append((request_name, request_data))
+        future = concurrent.futures.Future()
+        self.futures.append(future)
+        return future
+
+    def wait_for_futures(self, futures):
+        return [future.result() for future in futures]
+
+
+@pytest.fixture
+def module_proxy(request):
+    """Return a function to create an api module proxy that sends requests to a stub client."""
+
+    def _module_proxy(sio):
+        proxy = proxy_wrapper.AliasClientModuleProxyWrapper(
+            {"__module_name__": f"alias_api_{request.node.name}", "__members__": []}
+        )
+        proxy.get_or_create_module(sio)
+        return proxy
+
+    return _module_proxy
+
+
+####################################################################################################
+# tk_framework_alias client proxy_wrapper AliasClientObjectProxyWrapper
+####################################################################################################
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {},
+        {"name": "value"},
+        {"name": "value", "__property_name__": "name"},
+        {f"__key{i}__": i for i in range(10)},
+        {1: "value"},
+        {None: "value", "__property_name__": "name"},
+    ],
+)
+def test_create_proxy_not_proxy_data(data):
+    """Test the AliasClientObjectProxyWrapper create_proxy method with data that is not a proxy."""
+
+    assert proxy_wrapper.AliasClientObjectProxyWrapper.create_proxy(data) is None
+
+
+####################################################################################################
+# tk_framework_alias client proxy_wrapper AliasClientModuleProxyWrapper
+####################################################################################################
+
+
+def test_alias_module_attributes():
+    """Test that the api module created from the proxy data has all its attributes set."""
+
+    create_proxy = proxy_wrapper.AliasClientObjectProxyWrapper.create_proxy
+    module_name = "alias_api_module_attributes"
+    module_proxy = create_proxy(
+        {
+            "__module_name__": module_name,
+            "__members__": [
+                ["version", "1.0"],
+                [
+                    "get_layers",
+                    create_proxy(
+                        {"__function_name__": "get_layers", "__is_method__": False}
+                    ),
+                ],
+                [
+                    "AlLayer",
+                    create_proxy(
+                        {
+                            "__module_name__": module_name,
+                            "__class_name__": "AlLayer",
+                            "__members__": [],
+                        }
+                    ),
+                ],
+            ],
+        }
+    )
+    module = module_proxy.get_or_create_module(None)
+
+    module_vars = vars(module)
+    assert module_vars["version"] == "1.0"
+    assert callable(module_vars["get_layers"])
+    assert isinstance(module_vars["AlLayer"], type)
+    assert dict(inspect.getmembers(module, inspect.isclass)) == {
+        "AlLayer": module.AlLayer
+    }
+    assert sorted(module.__all__) == ["AlLayer", "get_layers", "version"]
+
+
+def test_send_request(module_proxy):
+    """Test the send_request method returns the request result when not in batch mode."""
+
+    sio = StubClient()
+    proxy = module_proxy(sio)
+
+    result = proxy.send_request("get_layers", {"__function_name__": "get_layers"})
+
+    assert result == "get_layers result"
+    assert sio.sent == [("get_layers", {"__function_name__": "get_layers"})]
+
+
+def test_batch_requests_resolve_futures(module_proxy):
+    """Test that the Futures returned in batch mode are resolved with the batch results."""
+
+    sio = StubClient(batch_result=["a", "b"])
+    proxy = module_proxy(sio)
+
+    proxy.batch_requests(True)
+    future_a = proxy.send_request("a", {"__function_name__": "a"})
+    future_b = proxy.send_request("b", {"__function_name__": "b"})
+
+    assert isinstance(future_a, concurrent.futures.Future)
+    assert not future_a.done() and not future_b.done()
+    assert proxy.num_pending_requests == 2
+    assert sio.sent == []
+
+    result = proxy.batch_requests(False)
+
+    assert result == ["a", "b"]
+    assert future_a.result(0) == "a"
+    assert future_b.result(0) == "b"
+    assert proxy.num_pending_requests == 0
+    assert sio.sent == [
+        (
+            "batch_requests",
+            [("a", {"__function_name__": "a"}), ("b", {"__function_name__": "b"})],
+        )
+    ]
+
+
+def test_batch_requests_async_cancel_futures(module_proxy):
+    """Test that the Futures returned in batch mode are cancelled on async execution."""
+
+    sio = StubClient()
+    proxy = module_proxy(sio)
+
+    proxy.batch_requests(True)
+    future = proxy.send_request("a", {"__function_name__": "a"})
+
+    result = proxy.batch_requests(False, is_async=True)
+
+    assert result is None
+    assert future.cancelled()
+    assert proxy.num_pending_requests == 0
+    assert sio.sent == [("batch_requests", [("a", {"__function_name__": "a"})])]
+
+
+@pytest.mark.parametrize("batch_result", [None, ["a"], ["a", "b", "c"]])
+def test_batch_requests_result_mismatch(module_proxy, batch_result):
+    """Test that the batch Futures are failed when the batch results do not match."""
+
+    sio = StubClient(batch_result=batch_result)
+    proxy = module_proxy(sio)
+
+    proxy.batch_requests(True)
+    futures = [
+        proxy.send_request("a", {"__function_name__": "a"}),
+        proxy.send_request("b", {"__function_name__": "b"}),
+    ]
+
+    result = proxy.batch_requests(False)
+
+    assert result == batch_result
+    for future in futures:
+        with pytest.raises(AliasClientBatchRequestError):
+            future.result(0)
+    assert proxy.num_pending_requests == 0
+
+
+def test_batch_requests_error(module_proxy):
+    """Test that the batch Futures are failed and the error raised when the batch fails."""
+
+    error = ValueError("Batch failed")
+    sio = StubClient(batch_error=error)
+    proxy = module_proxy(sio)
+
+    proxy.batch_requests(True)
+    future = proxy.send_request("a", {"__function_name__": "a"})
+
+    with pytest.raises(ValueError):
+        proxy.batch_requests(False)
+
+    assert future.exception(0) is error
+    assert proxy.num_pending_requests == 0
+
+
+def test_send_request_async(module_proxy):
+    """Test the send_request_async and wait_for_requests methods."""
+
+    sio = StubClient()
+    proxy = module_proxy(sio)
+
+    future_a = proxy.send_request_async("a", {"__function_name__": "a"})
+    future_b = proxy.send_request_async("b", {"__function_name__": "b"})
+
+    assert [future_a, future_b] == sio.futures
+    assert [name for name, _ in sio.sent] == ["a", "b"]
+
+    future_b.set_result("b result")
+    future_a.set_result("a result")
+
+    assert proxy.wait_for_requests([future_a, future_b]) == ["a result", "b result"]
+
+
+def test_send_request_async_batch_mode(module_proxy):
+    """Test the send_request_async method defers the request in batch mode."""
+
+    sio = StubClient(batch_result=["a"])
+    proxy = module_proxy(sio)
+
+    proxy.batch_requests(True)
+    future = proxy.send_request_async("a", {"__function_name__": "a"})
+
+    assert sio.futures == []
+    assert proxy.num_pending_requests == 1
+
+    proxy.batch_requests(False)
+
+    assert future.result(0) == "a"
+
+
+def test_send_request_async_sanitize_callback(module_proxy):
+    """Test the send_request_async method registers function arguments as callbacks."""
+
+    class CallbackStubClient(StubClient):
+        def set_callback(self, callback):
+            return callback.__name__
+
+    def my_callback():
+        pass
+
+    sio = CallbackStubClient()
+    proxy = module_proxy(sio)
+
+    proxy.send_request_async(
+        "a", {"__function_name__": "a", "__function_args__": [1, my_callback]}
+    )
+
+    assert sio.sent[0][1]["__function_args__"] == [
+        1,
+        {"__callback_function_id__": "my_callback"},
+    ]
+
+
+####################################################################################################
+# tk_framework_alias client proxy_wrapper AliasClientClassProxyWrapper
+####################################################################################################
+
+
+def test_create_alias_class_once():
+    """Test the AliasClientClassProxyWrapper creates its class type once."""
+
+    class_proxy = proxy_wrapper.AliasClientObjectProxyWrapper.create_proxy(
+        {
+            "__module_name__": "alias_api",
+            "__class_name__": "my_class",
+            "__members__": [["value", 1]],
+        }
+    )
+
+    class_type = class_proxy.create_object(None, "my_class")
+
+    assert class_type.__name__ == "my_class"
+    assert class_type.value == 1
+    assert class_proxy.create_object(None, "my_class") is class_type
+
+
+####################################################################################################
+# tk_framework_alias client proxy_wrapper AliasClientEnumProxyWrapper
+####################################################################################################
+
+
+def test_alias_enum_equality_and_hash():
+    """Test AliasClientEnumProxyWrapper objects compare and hash by enum type and value."""
+
+    def enum_data(class_name, name, value):
+        return {
+            "__module_name__": "alias_api",
+            "__class_name__": class_name,
+            "__enum_name__": name,
+            "__enum_value__": value,
+        }
+
+    create_proxy = proxy_wrapper.AliasClientObjectProxyWrapper.create_proxy
+    red = create_proxy(enum_data("TestColor", "kRed", 1))
+    red_again = create_proxy(enum_data("TestColor", "kRed", 1))
+    blue = create_proxy(enum_data("TestColor", "kBlue", 2))
+    other_red = create_proxy(enum_data("TestOtherColor", "kRed", 1))
+
+    assert red == red_again
+    assert hash(red) == hash(red_again)
+    assert red != blue
+    assert red != other_red
+    assert {red: "red"}[red_again] == "red"
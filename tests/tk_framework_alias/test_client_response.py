@@ -0,0 +1,64 @@
+# Copyright (c) 2024 Autodesk Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the ShotGrid Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the ShotGrid Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Autodesk Inc.
+
+import pytest
+
+from tk_framework_alias.client.socketio.client_response import ClientResponse
+
+
+####################################################################################################
+# tk_framework_alias client_response ClientResponse
+####################################################################################################
+
+
+def test_response_init():
+    """Test the ClientResponse is not acknowledged on init."""
+
+    response = ClientResponse()
+
+    assert response.ack is False
+    assert response.result is None
+    assert not response.event.is_set()
+    assert response.get("ack") is False
+    assert response["result"] is None
+
+
+@pytest.mark.parametrize(
+    "result,expected",
+    [
+        ((None,), None),
+        ((1,), 1),
+        (({"a": 1},), {"a": 1}),
+        ((1, 2), (1, 2)),
+        ((), ()),
+    ],
+)
+def test_response_set_result(result, expected):
+    """Test the ClientResponse set_result method."""
+
+    response = ClientResponse()
+    response.set_result(*result)
+
+    assert response.ack is True
+    assert response.result == expected
+    assert response.event.is_set()
+    assert response.get("ack") is True
+    assert response["result"] == expected
+
+
+def test_response_invalid_key():
+    """Test accessing the ClientResponse with a key that is not a response value."""
+
+    response = ClientResponse()
+
+    assert response.get("event") is None
+    assert response.get("invalid", 1) == 1
+    with pytest.raises(KeyError):
+        response["invalid"]